@@ -6,19 +6,45 @@ FastAPI-based REST API with Prometheus metrics for monitoring Dante to SRT bridg
 
 import os
 import re
-import json
 import time
-import subprocess
-from datetime import datetime
+import types
+import shlex
+import asyncio
+import threading
+import functools
+import configparser
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict, List
 
+try:
+    # RE2 scans in a single linear-time DFA pass instead of backtracking;
+    # optional because aarch64 wheels are not available everywhere.
+    # google-re2 is not fully re-compatible (no flag constants, bytes
+    # group names for bytes patterns), so probe the exact API the log
+    # parsers rely on instead of trusting the import alone.
+    import re2 as _log_re
+    _probe = next(_log_re.compile(rb'(?i)(?P<f>abc)').finditer(b'xABCx'))
+    if _probe.lastgroup is None or _probe.group(_probe.lastindex) != b'ABC':
+        _log_re = re
+    del _probe
+except Exception:
+    _log_re = re
+
+try:
+    # Optional: vectorized audio-level classification for high channel counts
+    import numpy as np
+except ImportError:
+    np = None
+
+import aiofiles
+import orjson
+from dbus_fast import BusType, DBusError
+from dbus_fast.aio import MessageBus
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
-from prometheus_client import Counter, Gauge, Histogram, Info, generate_latest, CONTENT_TYPE_LATEST
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response
+from prometheus_client import Counter, Gauge, Histogram, Info, make_asgi_app
 from pydantic import BaseModel
-import psutil
 
 # ============================================================================
 # Configuration
@@ -29,6 +55,9 @@ LOG_DIR = Path("/var/log/inferno")
 STATE_FILE = Path("/var/run/inferno/state.json")
 AUDIO_OUT_CONFIG = Path("/opt/inferno/config/audio-output.conf")
 
+# Channels below this level are reported as silent
+SILENCE_THRESHOLD_DBFS = -60.0
+
 # ============================================================================
 # FastAPI Application
 # ============================================================================
@@ -38,7 +67,8 @@ app = FastAPI(
     description="Monitoring API for Dante to SRT audio bridge",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # ============================================================================
@@ -79,9 +109,53 @@ api_uptime = Gauge('inferno_api_uptime_seconds', 'API uptime in seconds')
 http_requests = Counter('inferno_http_requests_total', 'Total HTTP requests', ['method', 'endpoint', 'status'])
 http_request_duration = Histogram('inferno_http_request_duration_seconds', 'HTTP request duration', ['method', 'endpoint'])
 
+# Pre-bound label children: the label sets are fixed, so the .labels()
+# hash + dict lookup is resolved once instead of on every update
+MONITORED_SERVICES = ("statime", "inferno", "inferno-srt")
+SERVICE_UP = {
+    name: service_up.labels(service=name)
+    for name in MONITORED_SERVICES + ("inferno-audio-out",)
+}
+SERVICE_RESTARTS = {
+    name: service_restarts.labels(service=name)
+    for name in MONITORED_SERVICES
+}
+
+# Audio channel children are bound on first use (channel count comes from config)
+_audio_channel_metrics = {}
+
+def get_audio_channel_metrics(channel: int):
+    """Pre-bound (level, peak, silence) gauge children for one channel"""
+    metrics = _audio_channel_metrics.get(channel)
+    if metrics is None:
+        label = str(channel)
+        metrics = (
+            audio_level.labels(channel=label),
+            audio_peak.labels(channel=label),
+            silence_detected.labels(channel=label),
+        )
+        _audio_channel_metrics[channel] = metrics
+    return metrics
+
 # API start time
 API_START_TIME = time.time()
 
+def read_uptime() -> float:
+    """System uptime in seconds, straight from /proc/uptime"""
+    with open('/proc/uptime', 'rb') as f:
+        return float(f.read().split()[0])
+
+# Boot time never changes at runtime, so sample it once
+BOOT_TIME = time.time() - read_uptime()
+
+# Uptime gauges are computed at scrape time instead of being pushed from /status
+system_uptime.set_function(lambda: int(time.time() - BOOT_TIME))
+api_uptime.set_function(lambda: int(time.time() - API_START_TIME))
+
+# Serve /metrics straight from the prometheus_client ASGI app, bypassing
+# the FastAPI routing/response pipeline on every scrape
+app.mount("/metrics", make_asgi_app())
+
 # ============================================================================
 # Pydantic Models for Request/Response
 # ============================================================================
@@ -103,60 +177,286 @@ class AudioOutputStatus(BaseModel):
 # Helper Functions
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
+def _format_timestamp(bucket: int) -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO-8601 string, formatted at most once per 100ms
+
+    Every response carries a timestamp; caching the formatted string per
+    100ms bucket turns a datetime allocation + strftime per request into
+    an lru_cache hit.
+    """
+    return _format_timestamp(time.time_ns() // 100_000_000)
+
+def ttl_cache_async(ttl: float):
+    """Coalesce concurrent calls to an async function and reuse the result
+    for ttl seconds.
+
+    Callers arriving while a computation is in flight await the same task
+    instead of starting their own, so simultaneous scrapers (Prometheus +
+    a frontend) share one D-Bus query / log read.
+    """
+    def decorator(func):
+        cache = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args):
+            now = time.monotonic()
+            entry = cache.get(args)
+            if entry is not None:
+                expiry, task = entry
+                if not task.done() or now < expiry:
+                    return await asyncio.shield(task)
+            task = asyncio.ensure_future(func(*args))
+            cache[args] = (now + ttl, task)
+            return await asyncio.shield(task)
+
+        return wrapper
+    return decorator
+
+# Parsed config files, keyed by mtime so the hot path is a single stat().
+# Cached data is frozen read-only so endpoints can't mutate shared state.
+_CONFIG_CACHE = {"mtime": None, "data": None}
+_AUDIO_OUT_CACHE = {"mtime": None, "data": None}
+_CACHE_LOCK = threading.Lock()
+
 def load_config() -> Dict:
-    """Load installation configuration"""
-    config = {}
-    if CONFIG_FILE.exists():
-        current_section = None
-        with open(CONFIG_FILE, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if line.startswith('[') and line.endswith(']'):
-                    current_section = line[1:-1]
-                    config[current_section] = {}
-                elif '=' in line and current_section:
-                    key, value = line.split('=', 1)
-                    config[current_section][key.strip()] = value.strip()
-    return config
-
-def check_service_status(service_name: str) -> bool:
+    """Load installation configuration (cached until the file changes)"""
+    try:
+        st = CONFIG_FILE.stat()
+    except OSError:
+        return {}
+
+    with _CACHE_LOCK:
+        if st.st_mtime_ns == _CONFIG_CACHE["mtime"]:
+            return _CONFIG_CACHE["data"]
+
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.optionxform = str  # keep key case as written
+    try:
+        parser.read(CONFIG_FILE)
+    except configparser.Error as e:
+        print(f"Error parsing config: {e}")
+        return {}
+
+    frozen = types.MappingProxyType(
+        {section: types.MappingProxyType(dict(parser[section])) for section in parser.sections()}
+    )
+    with _CACHE_LOCK:
+        _CONFIG_CACHE["mtime"] = st.st_mtime_ns
+        _CONFIG_CACHE["data"] = frozen
+
+    return frozen
+
+SYSTEMD_BUS_NAME = 'org.freedesktop.systemd1'
+SYSTEMD_PATH = '/org/freedesktop/systemd1'
+
+class SystemdClient:
+    """Async client for the systemd D-Bus API.
+
+    Keeps one persistent system-bus connection and caches per-unit proxy
+    objects, so status queries are a single in-process IPC round-trip
+    instead of a systemctl fork per call.
+    """
+
+    def __init__(self):
+        self._bus = None
+        self._manager = None
+        self._units = {}
+        self._watches = {}
+        self._lock = asyncio.Lock()
+
+    async def _connect(self):
+        bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        introspection = await bus.introspect(SYSTEMD_BUS_NAME, SYSTEMD_PATH)
+        proxy = bus.get_proxy_object(SYSTEMD_BUS_NAME, SYSTEMD_PATH, introspection)
+        self._manager = proxy.get_interface('org.freedesktop.systemd1.Manager')
+        self._bus = bus
+
+        # Subscribe exactly once per connection — systemd rejects a second
+        # Subscribe() from the same client with AlreadySubscribed
+        try:
+            await self._manager.call_subscribe()
+        except DBusError as e:
+            if e.type != 'org.freedesktop.systemd1.AlreadySubscribed':
+                raise
+
+    async def _ensure_connected(self):
+        # Caller must hold self._lock
+        if self._bus is None or not self._bus.connected:
+            self._units.clear()
+            await self._connect()
+
+            # A fresh connection dropped every signal handler, and counts
+            # may have changed while we were away: re-arm each watch and
+            # re-prime its callback with the current value
+            for service_name, callback in self._watches.items():
+                unit = await self._load_unit(service_name)
+                self._arm_watch(unit, callback)
+                service = unit.get_interface('org.freedesktop.systemd1.Service')
+                callback(await service.get_n_restarts())
+
+    async def _get_manager(self):
+        async with self._lock:
+            await self._ensure_connected()
+            return self._manager
+
+    async def _load_unit(self, service_name: str):
+        # Caller must hold self._lock
+        if service_name not in self._units:
+            unit_path = await self._manager.call_load_unit(f'{service_name}.service')
+            introspection = await self._bus.introspect(SYSTEMD_BUS_NAME, unit_path)
+            self._units[service_name] = self._bus.get_proxy_object(
+                SYSTEMD_BUS_NAME, unit_path, introspection
+            )
+        return self._units[service_name]
+
+    async def _get_unit(self, service_name: str):
+        async with self._lock:
+            await self._ensure_connected()
+            return await self._load_unit(service_name)
+
+    @staticmethod
+    def _arm_watch(unit, callback):
+        def on_properties_changed(interface_name, changed, invalidated):
+            if interface_name == 'org.freedesktop.systemd1.Service' and 'NRestarts' in changed:
+                callback(changed['NRestarts'].value)
+
+        props = unit.get_interface('org.freedesktop.DBus.Properties')
+        props.on_properties_changed(on_properties_changed)
+
+    async def active_state(self, service_name: str) -> str:
+        unit = await self._get_unit(service_name)
+        return await unit.get_interface('org.freedesktop.systemd1.Unit').get_active_state()
+
+    async def restart_count(self, service_name: str) -> int:
+        unit = await self._get_unit(service_name)
+        return await unit.get_interface('org.freedesktop.systemd1.Service').get_n_restarts()
+
+    async def start_unit(self, service_name: str):
+        manager = await self._get_manager()
+        await manager.call_start_unit(f'{service_name}.service', 'replace')
+
+    async def stop_unit(self, service_name: str):
+        manager = await self._get_manager()
+        await manager.call_stop_unit(f'{service_name}.service', 'replace')
+
+    async def restart_unit(self, service_name: str):
+        manager = await self._get_manager()
+        await manager.call_restart_unit(f'{service_name}.service', 'replace')
+
+    async def watch_restarts(self, service_name: str, callback):
+        """Invoke callback(count) now and whenever the unit's NRestarts changes
+
+        The watch survives reconnects: _ensure_connected re-arms it (and
+        re-primes the count) whenever a fresh bus connection is made.
+        """
+        unit = await self._get_unit(service_name)
+        self._watches[service_name] = callback
+        self._arm_watch(unit, callback)
+        callback(await self.restart_count(service_name))
+
+systemd_client = SystemdClient()
+
+@ttl_cache_async(ttl=0.5)
+async def check_service_status(service_name: str) -> bool:
     """Check if a systemd service is running"""
     try:
-        result = subprocess.run(
-            ['systemctl', 'is-active', f'{service_name}.service'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        is_active = result.stdout.strip() == 'active'
-        
+        is_active = await systemd_client.active_state(service_name) == 'active'
+
         # Update Prometheus metric
-        service_up.labels(service=service_name).set(1 if is_active else 0)
-        
+        SERVICE_UP[service_name].set(1 if is_active else 0)
+
         return is_active
-    except Exception as e:
-        service_up.labels(service=service_name).set(0)
+    except Exception:
+        SERVICE_UP[service_name].set(0)
         return False
 
-def get_service_restart_count(service_name: str) -> int:
+# Restart counts pushed by systemd's PropertiesChanged signal, so
+# steady-state reads cost no D-Bus round-trip at all
+_restart_counts = {}
+
+def _track_restart_count(service_name: str):
+    """Callback for watch_restarts: cache the count and bump the counter metric"""
+    def update(count: int):
+        previous = _restart_counts.get(service_name)
+        if previous is not None and count > previous and service_name in SERVICE_RESTARTS:
+            SERVICE_RESTARTS[service_name].inc(count - previous)
+        _restart_counts[service_name] = count
+    return update
+
+@ttl_cache_async(ttl=0.5)
+async def get_service_restart_count(service_name: str) -> int:
     """Get number of times a service has restarted"""
+    count = _restart_counts.get(service_name)
+    if count is not None:
+        return count
     try:
-        result = subprocess.run(
-            ['systemctl', 'show', f'{service_name}.service', '--property=NRestarts'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        match = re.search(r'NRestarts=(\d+)', result.stdout)
-        if match:
-            return int(match.group(1))
+        return await systemd_client.restart_count(service_name)
     except Exception:
-        pass
-    return 0
+        return 0
+
+# Log tail bounds: at most this many bytes read per scrape, then the
+# last LOG_TAIL_LINES lines are scanned
+LOG_TAIL_BYTES = 64 * 1024
+LOG_TAIL_LINES = 100
 
-def parse_statime_log() -> Dict:
+# Log-scan patterns, precompiled once over bytes (log tails stay undecoded).
+# One alternation per log so each line is scanned in a single pass;
+# match_field() tells the parser which field was hit. Compiled through
+# RE2 when available, stdlib re otherwise (see _log_re above) — hence
+# inline (?i) rather than a flags argument, which re2 does not accept.
+PTP_LINE_RE = _log_re.compile(
+    rb'(?i)offset[:\s]+(?P<offset>-?\d+)'
+    rb'|\b(?P<slave>slave|listening)\b'
+    rb'|\b(?P<master>master)\b'
+)
+# PTP logs mention "master" constantly (BMCA, announce messages); only
+# lines that also talk about state are actual state changes
+PTP_STATE_RE = _log_re.compile(rb'(?i)state')
+INFERNO_LINE_RE = _log_re.compile(
+    rb'(?i)(?P<channels>\d+)\s*channels?'
+    rb'|(?P<sample_rate>\d+)\s*hz'
+    rb'|received[:\s]+(?P<received>\d+)'
+    rb'|lost[:\s]+(?P<lost>\d+)'
+)
+SRT_LINE_RE = _log_re.compile(
+    rb'(?i)(?P<url>srt://[^\s\'"]+)'
+    rb'|(?P<bitrate>\d+\.?\d*)\s*kbits?/s'
+    rb'|loss[:\s]*(?P<loss>\d+\.?\d*)%'
+)
+SRT_ERROR_RE = _log_re.compile(rb'(?i)error|failed')
+
+def match_field(match):
+    """Engine-independent (field name, captured value) for an alternation match
+
+    re2 reports bytes group names for bytes patterns where stdlib re
+    reports str, and rejects str names in group(); normalize the name and
+    fetch the value positionally, which both engines agree on.
+    """
+    group = match.lastgroup
+    if isinstance(group, bytes):
+        group = group.decode()
+    return group, match.group(match.lastindex)
+
+# parse_srt_log early-exit mask: one bit per field still to fill
+SRT_NEED_URL, SRT_NEED_BITRATE, SRT_NEED_LOSS = 1, 2, 4
+SRT_NEED_ALL = SRT_NEED_URL | SRT_NEED_BITRATE | SRT_NEED_LOSS
+
+async def read_log_tail(log_file: Path) -> List[bytes]:
+    """Read the last lines of a log without loading the whole file"""
+    async with aiofiles.open(log_file, 'rb') as f:
+        try:
+            await f.seek(-LOG_TAIL_BYTES, os.SEEK_END)
+        except OSError:
+            await f.seek(0)
+        tail = await f.read()
+    return tail.splitlines()[-LOG_TAIL_LINES:]
+
+@ttl_cache_async(ttl=0.5)
+async def parse_statime_log() -> Dict:
     """Parse Statime log for PTP status"""
     ptp_status = {
         "synchronized": False,
@@ -164,43 +464,42 @@ def parse_statime_log() -> Dict:
         "master_ip": None,
         "state": "unknown"
     }
-    
+
     log_file = LOG_DIR / "statime.log"
     if not log_file.exists():
         return ptp_status
-    
+
     try:
-        # Read last 100 lines
-        with open(log_file, 'r') as f:
-            lines = f.readlines()[-100:]
-        
+        lines = await read_log_tail(log_file)
+
+        found_offset = False
         for line in reversed(lines):
-            # Look for clock offset messages
-            if 'offset' in line.lower():
-                match = re.search(r'offset[:\s]+(-?\d+)', line)
-                if match:
-                    offset = int(match.group(1))
+            for match in PTP_LINE_RE.finditer(line):
+                group, value = match_field(match)
+                if group == 'offset':
+                    offset = int(value)
                     ptp_status["clock_offset_ns"] = offset
                     ptp_status["synchronized"] = abs(offset) < 100000  # <100μs = synced
-                    
+
                     # Update Prometheus metrics
                     ptp_clock_offset.set(offset)
                     ptp_synchronized.set(1 if ptp_status["synchronized"] else 0)
+                    found_offset = True
                     break
-            
-            # Look for state changes
-            if 'state' in line.lower():
-                if 'slave' in line.lower() or 'listening' in line.lower():
+                elif group == 'slave' and PTP_STATE_RE.search(line):
                     ptp_status["state"] = "slave"
-                elif 'master' in line.lower():
+                elif group == 'master' and PTP_STATE_RE.search(line):
                     ptp_status["state"] = "master"
-    
+            if found_offset:
+                break
+
     except Exception as e:
         print(f"Error parsing statime log: {e}")
-    
+
     return ptp_status
 
-def parse_inferno_log() -> Dict:
+@ttl_cache_async(ttl=0.5)
+async def parse_inferno_log() -> Dict:
     """Parse Inferno log for audio status"""
     audio_status = {
         "rx_channels": 0,
@@ -209,44 +508,33 @@ def parse_inferno_log() -> Dict:
         "packets_received": 0,
         "packets_lost": 0
     }
-    
+
     log_file = LOG_DIR / "inferno.log"
     if not log_file.exists():
         return audio_status
-    
+
     try:
-        with open(log_file, 'r') as f:
-            lines = f.readlines()[-100:]
-        
+        lines = await read_log_tail(log_file)
+
         for line in reversed(lines):
-            # Look for channel info
-            if 'channels' in line.lower():
-                match = re.search(r'(\d+)\s*channels?', line)
-                if match:
-                    audio_status["rx_channels"] = int(match.group(1))
-            
-            # Look for sample rate
-            if 'sample rate' in line.lower() or 'hz' in line.lower():
-                match = re.search(r'(\d+)\s*hz', line, re.IGNORECASE)
-                if match:
-                    audio_status["sample_rate"] = int(match.group(1))
-            
-            # Look for packet stats
-            if 'packets' in line.lower():
-                match = re.search(r'received[:\s]+(\d+)', line, re.IGNORECASE)
-                if match:
-                    audio_status["packets_received"] = int(match.group(1))
-                
-                match = re.search(r'lost[:\s]+(\d+)', line, re.IGNORECASE)
-                if match:
-                    audio_status["packets_lost"] = int(match.group(1))
-    
+            for match in INFERNO_LINE_RE.finditer(line):
+                group, value = match_field(match)
+                if group == 'channels':
+                    audio_status["rx_channels"] = int(value)
+                elif group == 'sample_rate':
+                    audio_status["sample_rate"] = int(value)
+                elif group == 'received':
+                    audio_status["packets_received"] = int(value)
+                elif group == 'lost':
+                    audio_status["packets_lost"] = int(value)
+
     except Exception as e:
         print(f"Error parsing inferno log: {e}")
-    
+
     return audio_status
 
-def parse_srt_log() -> Dict:
+@ttl_cache_async(ttl=0.5)
+async def parse_srt_log() -> Dict:
     """Parse FFmpeg SRT log for streaming status"""
     srt_status = {
         "connected": False,
@@ -255,60 +543,101 @@ def parse_srt_log() -> Dict:
         "rtt_ms": 0,
         "packet_loss_pct": 0.0
     }
-    
+
     log_file = LOG_DIR / "srt.log"
     if not log_file.exists():
         return srt_status
-    
+
     try:
-        with open(log_file, 'r') as f:
-            lines = f.readlines()[-100:]
-        
+        lines = await read_log_tail(log_file)
+
+        # Scanning newest-first, the first hit per field wins; the loop ends
+        # as soon as every field has been filled, so the common case touches
+        # only the last few lines
+        needed = SRT_NEED_ALL
         for line in reversed(lines):
-            # Check for SRT connection
-            if 'srt://' in line.lower():
-                match = re.search(r'(srt://[^\s\'"]+)', line)
-                if match:
-                    srt_status["destination"] = match.group(1)
-                    srt_status["connected"] = 'error' not in line.lower() and 'failed' not in line.lower()
-            
-            # Look for bitrate
-            if 'bitrate' in line.lower() or 'kbits/s' in line.lower():
-                match = re.search(r'(\d+\.?\d*)\s*kbits?/s', line, re.IGNORECASE)
-                if match:
-                    srt_status["bitrate_kbps"] = float(match.group(1))
-            
-            # Look for packet loss
-            if 'loss' in line.lower():
-                match = re.search(r'(\d+\.?\d*)%', line)
-                if match:
-                    srt_status["packet_loss_pct"] = float(match.group(1))
-        
+            for match in SRT_LINE_RE.finditer(line):
+                group, value = match_field(match)
+                if group == 'url' and needed & SRT_NEED_URL:
+                    srt_status["destination"] = value.decode('utf-8', 'replace')
+                    srt_status["connected"] = SRT_ERROR_RE.search(line) is None
+                    needed &= ~SRT_NEED_URL
+                elif group == 'bitrate' and needed & SRT_NEED_BITRATE:
+                    srt_status["bitrate_kbps"] = float(value)
+                    needed &= ~SRT_NEED_BITRATE
+                elif group == 'loss' and needed & SRT_NEED_LOSS:
+                    srt_status["packet_loss_pct"] = float(value)
+                    needed &= ~SRT_NEED_LOSS
+            if not needed:
+                break
+
         # Update Prometheus metrics
         srt_connected.set(1 if srt_status["connected"] else 0)
         srt_bitrate.set(srt_status["bitrate_kbps"])
         srt_rtt.set(srt_status["rtt_ms"])
         srt_packet_loss.set(srt_status["packet_loss_pct"])
-    
+
     except Exception as e:
         print(f"Error parsing SRT log: {e}")
-    
+
     return srt_status
 
+# Previous /proc/stat sample for the CPU usage delta
+_cpu_sample = {"total": 0, "idle": 0}
+
+def read_cpu_percent() -> float:
+    """CPU usage since the previous call, from /proc/stat jiffy deltas
+
+    Non-blocking; the first call is primed at startup so request-time
+    readings always have a baseline.
+    """
+    with open('/proc/stat', 'rb') as f:
+        fields = [int(v) for v in f.readline().split()[1:]]
+    idle = fields[3] + fields[4]  # idle + iowait
+    total = sum(fields)
+    delta_total = total - _cpu_sample["total"]
+    delta_idle = idle - _cpu_sample["idle"]
+    _cpu_sample["total"] = total
+    _cpu_sample["idle"] = idle
+    if delta_total <= 0:
+        return 0.0
+    return round(100.0 * (delta_total - delta_idle) / delta_total, 1)
+
+def read_memory_percent() -> float:
+    """Used-memory percentage from /proc/meminfo (MemTotal vs MemAvailable)"""
+    total = available = None
+    with open('/proc/meminfo', 'rb') as f:
+        for line in f:
+            if line.startswith(b'MemTotal:'):
+                total = int(line.split()[1])
+            elif line.startswith(b'MemAvailable:'):
+                available = int(line.split()[1])
+                break
+    if not total or available is None:
+        return 0.0
+    return round((total - available) / total * 100, 1)
+
+def read_disk_percent(path: str = '/') -> float:
+    """Used-disk percentage via statvfs"""
+    s = os.statvfs(path)
+    if s.f_blocks == 0:
+        return 0.0
+    return round((1 - s.f_bavail / s.f_blocks) * 100, 1)
+
 def get_system_info() -> Dict:
     """Get system information"""
     return {
         "hostname": os.uname().nodename,
         "architecture": os.uname().machine,
         "kernel": os.uname().release,
-        "uptime_seconds": int(time.time() - psutil.boot_time()),
-        "cpu_percent": psutil.cpu_percent(interval=1),
-        "memory_percent": psutil.virtual_memory().percent,
-        "disk_percent": psutil.disk_usage('/').percent
+        "uptime_seconds": int(time.time() - BOOT_TIME),
+        "cpu_percent": read_cpu_percent(),
+        "memory_percent": read_memory_percent(),
+        "disk_percent": read_disk_percent()
     }
 
 def read_audio_output_config() -> Dict:
-    """Read hardware audio output configuration"""
+    """Read hardware audio output configuration (cached until the file changes)"""
     config = {
         "enabled": False,
         "device": "auto",
@@ -317,50 +646,94 @@ def read_audio_output_config() -> Dict:
         "channel_r": 1,
         "rx_channels": 2
     }
-    
-    if not AUDIO_OUT_CONFIG.exists():
-        return config
-    
+
+    try:
+        st = AUDIO_OUT_CONFIG.stat()
+    except OSError:
+        return types.MappingProxyType(config)
+
+    with _CACHE_LOCK:
+        if st.st_mtime_ns == _AUDIO_OUT_CACHE["mtime"]:
+            return _AUDIO_OUT_CACHE["data"]
+
     try:
         with open(AUDIO_OUT_CONFIG, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('ENABLED='):
-                    config["enabled"] = line.split('=')[1].strip('"').lower() == "true"
-                elif line.startswith('DEVICE='):
-                    config["device"] = line.split('=')[1].strip('"')
-                elif line.startswith('STEREO_PAIR='):
-                    config["stereo_pair"] = int(line.split('=')[1].strip('"'))
-                elif line.startswith('CHANNEL_L='):
-                    config["channel_l"] = int(line.split('=')[1].strip('"'))
-                elif line.startswith('CHANNEL_R='):
-                    config["channel_r"] = int(line.split('=')[1].strip('"'))
-                elif line.startswith('RX_CHANNELS='):
-                    config["rx_channels"] = int(line.split('=')[1].strip('"'))
+            contents = f.read()
+
+        # The file is a shell fragment (KEY="value"); shlex handles the
+        # quoting and comments instead of per-key startswith/strip chains
+        for token in shlex.split(contents, comments=True, posix=True):
+            key, sep, value = token.partition('=')
+            if not sep:
+                continue
+            if key == 'ENABLED':
+                config["enabled"] = value.lower() == "true"
+            elif key == 'DEVICE':
+                config["device"] = value
+            elif key == 'STEREO_PAIR':
+                config["stereo_pair"] = int(value)
+            elif key == 'CHANNEL_L':
+                config["channel_l"] = int(value)
+            elif key == 'CHANNEL_R':
+                config["channel_r"] = int(value)
+            elif key == 'RX_CHANNELS':
+                config["rx_channels"] = int(value)
     except Exception as e:
         print(f"Error reading audio output config: {e}")
-    
-    return config
+        return types.MappingProxyType(config)
+
+    frozen = types.MappingProxyType(config)
+    with _CACHE_LOCK:
+        _AUDIO_OUT_CACHE["mtime"] = st.st_mtime_ns
+        _AUDIO_OUT_CACHE["data"] = frozen
+
+    return frozen
+
+AUDIO_OUT_TEMPLATE = (
+    '# Hardware audio output configuration\n'
+    '# This file can be modified via API or manually\n'
+    'ENABLED="{enabled}"\n'
+    'DEVICE="{device}"\n'
+    'STEREO_PAIR="{stereo_pair}"\n'
+    'CHANNEL_L="{channel_l}"\n'
+    'CHANNEL_R="{channel_r}"\n'
+    'RX_CHANNELS="{rx_channels}"\n'
+)
 
 def write_audio_output_config(config: Dict) -> bool:
-    """Write hardware audio output configuration"""
+    """Write hardware audio output configuration atomically"""
     try:
         AUDIO_OUT_CONFIG.parent.mkdir(parents=True, exist_ok=True)
-        
+
         # Calculate channel numbers from stereo pair
         channel_l = (config["stereo_pair"] - 1) * 2
         channel_r = (config["stereo_pair"] - 1) * 2 + 1
-        
-        with open(AUDIO_OUT_CONFIG, 'w') as f:
-            f.write("# Hardware audio output configuration\n")
-            f.write("# This file can be modified via API or manually\n")
-            f.write(f'ENABLED="{str(config["enabled"]).lower()}"\n')
-            f.write(f'DEVICE="{config["device"]}"\n')
-            f.write(f'STEREO_PAIR="{config["stereo_pair"]}"\n')
-            f.write(f'CHANNEL_L="{channel_l}"\n')
-            f.write(f'CHANNEL_R="{channel_r}"\n')
-            f.write(f'RX_CHANNELS="{config.get("rx_channels", 2)}"\n')
-        
+
+        payload = AUDIO_OUT_TEMPLATE.format_map({
+            "enabled": str(config["enabled"]).lower(),
+            "device": config["device"],
+            "stereo_pair": config["stereo_pair"],
+            "channel_l": channel_l,
+            "channel_r": channel_r,
+            "rx_channels": config.get("rx_channels", 2),
+        }).encode()
+
+        # Write to a temp file, fsync, then rename over the target so a
+        # crash or concurrent reader never sees a half-written config
+        tmp_path = AUDIO_OUT_CONFIG.with_suffix('.conf.tmp')
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, AUDIO_OUT_CONFIG)
+
+        # Force a re-read even if the replacement lands on the same mtime tick
+        with _CACHE_LOCK:
+            _AUDIO_OUT_CACHE["mtime"] = None
+            _AUDIO_OUT_CACHE["data"] = None
+
         return True
     except Exception as e:
         print(f"Error writing audio output config: {e}")
@@ -370,6 +743,29 @@ def write_audio_output_config(config: Dict) -> bool:
 # API Endpoints
 # ============================================================================
 
+# /health and /status have fixed schemas and are the endpoints scrapers
+# hammer, so their bodies are %-formatted into prebuilt bytes templates —
+# no per-request dict construction or serializer traversal. String values
+# still go through orjson.dumps for correct JSON escaping.
+HEALTH_TEMPLATE = (
+    b'{"healthy":%s,'
+    b'"services":{"statime":%s,"inferno":%s,"srt":%s},'
+    b'"timestamp":%s}'
+)
+STATUS_TEMPLATE = (
+    b'{"timestamp":%s,'
+    b'"uptime_seconds":%d,'
+    b'"api_uptime_seconds":%d,'
+    b'"services":{"statime":%s,"inferno":%s,"srt":%s},'
+    b'"audio":{"rx_channels":%d,"tx_channels":%d,"sample_rate":%d},'
+    b'"ptp":{"synchronized":%s,"clock_offset_ns":%d},'
+    b'"srt":{"connected":%s,"destination":%s},'
+    b'"device":{"name":%s,"dante_ip":%s}}'
+)
+
+def json_bool(value) -> bytes:
+    return b'true' if value else b'false'
+
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
@@ -395,62 +791,54 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    services = {
-        "statime": check_service_status("statime"),
-        "inferno": check_service_status("inferno"),
-        "srt": check_service_status("inferno-srt")
-    }
-    
-    healthy = all(services.values())
-    
-    return {
-        "healthy": healthy,
-        "services": services,
-        "timestamp": datetime.utcnow().isoformat() + "Z"
-    }
+    statime_up, inferno_up, srt_up = await asyncio.gather(
+        check_service_status("statime"),
+        check_service_status("inferno"),
+        check_service_status("inferno-srt")
+    )
+
+    body = HEALTH_TEMPLATE % (
+        json_bool(statime_up and inferno_up and srt_up),
+        json_bool(statime_up),
+        json_bool(inferno_up),
+        json_bool(srt_up),
+        orjson.dumps(utc_now_iso())
+    )
+    return Response(content=body, media_type="application/json")
 
 @app.get("/status")
 async def get_status():
     """Get overall system status"""
     config = load_config()
-    
-    services = {
-        "statime": check_service_status("statime"),
-        "inferno": check_service_status("inferno"),
-        "srt": check_service_status("inferno-srt")
-    }
-    
-    audio_info = parse_inferno_log()
-    ptp_info = parse_statime_log()
-    srt_info = parse_srt_log()
-    
-    # Update uptime metrics
-    system_uptime.set(int(time.time() - psutil.boot_time()))
-    api_uptime.set(int(time.time() - API_START_TIME))
-    
-    return {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "uptime_seconds": int(time.time() - psutil.boot_time()),
-        "api_uptime_seconds": int(time.time() - API_START_TIME),
-        "services": services,
-        "audio": {
-            "rx_channels": audio_info.get("rx_channels", 0),
-            "tx_channels": audio_info.get("tx_channels", 0),
-            "sample_rate": audio_info.get("sample_rate", 0)
-        },
-        "ptp": {
-            "synchronized": ptp_info.get("synchronized", False),
-            "clock_offset_ns": ptp_info.get("clock_offset_ns", 0)
-        },
-        "srt": {
-            "connected": srt_info.get("connected", False),
-            "destination": srt_info.get("destination")
-        },
-        "device": {
-            "name": config.get("inferno", {}).get("device_name", "Unknown"),
-            "dante_ip": config.get("network", {}).get("dante_ip", "Unknown")
-        }
-    }
+
+    # One gather: service checks and log parses overlap instead of serializing
+    statime_up, inferno_up, srt_up, audio_info, ptp_info, srt_info = await asyncio.gather(
+        check_service_status("statime"),
+        check_service_status("inferno"),
+        check_service_status("inferno-srt"),
+        parse_inferno_log(),
+        parse_statime_log(),
+        parse_srt_log()
+    )
+    now = time.time()
+    body = STATUS_TEMPLATE % (
+        orjson.dumps(utc_now_iso()),
+        int(now - BOOT_TIME),
+        int(now - API_START_TIME),
+        json_bool(statime_up),
+        json_bool(inferno_up),
+        json_bool(srt_up),
+        audio_info.get("rx_channels", 0),
+        audio_info.get("tx_channels", 0),
+        audio_info.get("sample_rate", 0),
+        json_bool(ptp_info.get("synchronized", False)),
+        ptp_info.get("clock_offset_ns", 0),
+        json_bool(srt_info.get("connected", False)),
+        orjson.dumps(srt_info.get("destination")),
+        orjson.dumps(config.get("inferno", {}).get("device_name", "Unknown")),
+        orjson.dumps(config.get("network", {}).get("dante_ip", "Unknown"))
+    )
+    return Response(content=body, media_type="application/json")
 
 @app.get("/status/services")
 async def get_services_status():
@@ -458,8 +846,8 @@ async def get_services_status():
     services = {}
     
     for service in ["statime", "inferno", "inferno-srt"]:
-        is_running = check_service_status(service)
-        restart_count = get_service_restart_count(service)
+        is_running = await check_service_status(service)
+        restart_count = await get_service_restart_count(service)
         
         services[service] = {
             "running": is_running,
@@ -468,10 +856,10 @@ async def get_services_status():
         }
         
         # Update restart counter metric
-        service_restarts.labels(service=service).inc(0)  # Initialize if needed
+        SERVICE_RESTARTS[service].inc(0)  # Initialize if needed
     
     return {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_now_iso(),
         "services": services
     }
 
@@ -479,46 +867,56 @@ async def get_services_status():
 async def get_audio_status():
     """Get audio status and levels"""
     config = load_config()
-    audio_info = parse_inferno_log()
-    
+    audio_info = await parse_inferno_log()
+
     # Simulate audio levels (in production, read from shared memory or pipe)
-    # For now, return placeholder values
+    # For now, return placeholder values shaped like that future read
     rx_channels = int(config.get("inferno", {}).get("rx_channels", 2))
+
+    if np is not None:
+        # Classification happens in one vectorized comparison rather than
+        # a Python compare per channel — this is what keeps 64-channel
+        # devices cheap once real levels arrive as a float32 array
+        levels = np.full(rx_channels, -20.0, dtype=np.float32)
+        peaks = np.full(rx_channels, -15.0, dtype=np.float32)
+        silent_flags = (levels < SILENCE_THRESHOLD_DBFS).tolist()
+        levels = levels.tolist()
+        peaks = peaks.tolist()
+    else:
+        levels = [-20.0] * rx_channels
+        peaks = [-15.0] * rx_channels
+        silent_flags = [level < SILENCE_THRESHOLD_DBFS for level in levels]
+
     channels = []
-    
-    for i in range(rx_channels):
-        # TODO: Read actual audio levels from Inferno
-        level = -20.0  # Placeholder
-        peak = -15.0   # Placeholder
-        silent = level < -60.0
-        
+    for i, (level, peak, silent) in enumerate(zip(levels, peaks, silent_flags)):
         channels.append({
             "id": i,
             "level_dbfs": level,
             "peak_dbfs": peak,
             "silent": silent
         })
-        
+
         # Update Prometheus metrics
-        audio_level.labels(channel=str(i)).set(level)
-        audio_peak.labels(channel=str(i)).set(peak)
-        silence_detected.labels(channel=str(i)).set(1 if silent else 0)
-    
+        level_gauge, peak_gauge, silence_gauge = get_audio_channel_metrics(i)
+        level_gauge.set(level)
+        peak_gauge.set(peak)
+        silence_gauge.set(1 if silent else 0)
+
     return {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_now_iso(),
         "sample_rate": audio_info.get("sample_rate", 48000),
         "rx_channels": rx_channels,
         "channels": channels,
-        "silence_detected": any(ch["silent"] for ch in channels)
+        "silence_detected": any(silent_flags)
     }
 
 @app.get("/ptp/status")
 async def get_ptp_status():
     """Get PTP clock synchronization status"""
-    ptp_info = parse_statime_log()
+    ptp_info = await parse_statime_log()
     
     return {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_now_iso(),
         "synchronized": ptp_info.get("synchronized", False),
         "clock_offset_ns": ptp_info.get("clock_offset_ns", 0),
         "master_ip": ptp_info.get("master_ip"),
@@ -528,11 +926,11 @@ async def get_ptp_status():
 @app.get("/srt/status")
 async def get_srt_status():
     """Get SRT streaming status"""
-    srt_info = parse_srt_log()
+    srt_info = await parse_srt_log()
     config = load_config()
     
     return {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_now_iso(),
         "connected": srt_info.get("connected", False),
         "destination": srt_info.get("destination") or 
                       f"srt://{config.get('srt', {}).get('host', 'unknown')}:{config.get('srt', {}).get('port', '0')}",
@@ -547,7 +945,7 @@ async def get_srt_status():
 async def get_network_status():
     """Get network status"""
     config = load_config()
-    audio_info = parse_inferno_log()
+    audio_info = await parse_inferno_log()
     
     # Calculate packet loss rate
     total_packets = audio_info.get("packets_received", 0) + audio_info.get("packets_lost", 0)
@@ -557,7 +955,7 @@ async def get_network_status():
     packet_loss_rate.set(loss_rate)
     
     return {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_now_iso(),
         "dante_interface": config.get("network", {}).get("dante_interface", "eth0"),
         "dante_ip": config.get("network", {}).get("dante_ip", "Unknown"),
         "packets_received": audio_info.get("packets_received", 0),
@@ -572,7 +970,7 @@ async def get_system_info_endpoint():
     config = load_config()
     
     return {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_now_iso(),
         "hostname": system_info["hostname"],
         "architecture": system_info["architecture"],
         "kernel": system_info["kernel"],
@@ -586,11 +984,6 @@ async def get_system_info_endpoint():
         }
     }
 
-@app.get("/metrics")
-async def metrics():
-    """Prometheus metrics endpoint"""
-    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
-
 # ============================================================================
 # Hardware Audio Output Endpoints
 # ============================================================================
@@ -599,7 +992,7 @@ async def metrics():
 async def get_audio_output():
     """Get hardware audio output configuration and status"""
     config = read_audio_output_config()
-    service_running = check_service_status("inferno-audio-out")
+    service_running = await check_service_status("inferno-audio-out")
     
     return AudioOutputStatus(
         enabled=config["enabled"],
@@ -652,15 +1045,11 @@ async def set_audio_output(audio_config: AudioOutputConfig):
     # Restart service to apply changes
     try:
         if audio_config.enabled:
-            subprocess.run(['systemctl', 'restart', 'inferno-audio-out.service'], 
-                         check=True, timeout=10)
+            await systemd_client.restart_unit('inferno-audio-out')
         else:
-            subprocess.run(['systemctl', 'stop', 'inferno-audio-out.service'], 
-                         check=True, timeout=10)
-    except subprocess.CalledProcessError as e:
+            await systemd_client.stop_unit('inferno-audio-out')
+    except (DBusError, OSError) as e:
         raise HTTPException(status_code=500, detail=f"Failed to control service: {e}")
-    except subprocess.TimeoutExpired:
-        raise HTTPException(status_code=500, detail="Service control timeout")
     
     return {
         "success": True,
@@ -676,7 +1065,7 @@ async def set_audio_output(audio_config: AudioOutputConfig):
 @app.post("/audio/output/toggle")
 async def toggle_audio_output():
     """Toggle hardware audio output on/off"""
-    config = read_audio_output_config()
+    config = dict(read_audio_output_config())
     config["enabled"] = not config["enabled"]
     
     if not write_audio_output_config(config):
@@ -684,12 +1073,10 @@ async def toggle_audio_output():
     
     try:
         if config["enabled"]:
-            subprocess.run(['systemctl', 'start', 'inferno-audio-out.service'], 
-                         check=True, timeout=10)
+            await systemd_client.start_unit('inferno-audio-out')
         else:
-            subprocess.run(['systemctl', 'stop', 'inferno-audio-out.service'], 
-                         check=True, timeout=10)
-    except Exception as e:
+            await systemd_client.stop_unit('inferno-audio-out')
+    except (DBusError, OSError) as e:
         raise HTTPException(status_code=500, detail=f"Failed to toggle service: {e}")
     
     return {
@@ -706,10 +1093,21 @@ async def toggle_audio_output():
 async def startup_event():
     """Initialize metrics on startup"""
     print("Inferno AoIP Monitor API starting...")
-    
+
+    # Prime the CPU usage sampler so request-time readings have a baseline
+    read_cpu_percent()
+
     # Initialize all service metrics
     for service in ["statime", "inferno", "inferno-srt"]:
-        check_service_status(service)
+        await check_service_status(service)
+
+    # Restart counts become event-driven: systemd pushes PropertiesChanged
+    # and the API stops polling NRestarts per request
+    for service in MONITORED_SERVICES + ("inferno-audio-out",):
+        try:
+            await systemd_client.watch_restarts(service, _track_restart_count(service))
+        except Exception as e:
+            print(f"Could not subscribe to {service} restart signals: {e}")
     
     print("API ready at http://0.0.0.0:8080")
     print("Prometheus metrics at http://0.0.0.0:8080/metrics")
@@ -721,4 +1119,7 @@ async def startup_event():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080, log_level="info")
\ No newline at end of file
+    # uvloop + httptools (bundled with uvicorn[standard]) replace the
+    # pure-Python event loop and HTTP parser
+    uvicorn.run(app, host="0.0.0.0", port=8080, loop="uvloop", http="httptools",
+                log_level="info")
\ No newline at end of file
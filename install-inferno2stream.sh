@@ -267,12 +267,27 @@ pip3 install --break-system-packages \
     fastapi==0.104.1 \
     uvicorn[standard]==0.24.0 \
     prometheus-client==0.19.0 \
-    psutil==5.9.6 || \
+    dbus-fast==2.21.3 \
+    aiofiles==23.2.1 \
+    orjson==3.9.10 || \
 pip3 install \
     fastapi==0.104.1 \
     uvicorn[standard]==0.24.0 \
     prometheus-client==0.19.0 \
-    psutil==5.9.6
+    dbus-fast==2.21.3 \
+    aiofiles==23.2.1 \
+    orjson==3.9.10
+
+# Optional: RE2 regex engine for linear-time log scanning in the monitor API
+# (the API falls back to the stdlib re module if unavailable)
+pip3 install --break-system-packages google-re2==1.1.20240702 || \
+pip3 install google-re2==1.1.20240702 || \
+echo -e "${YELLOW}⚠ google-re2 not available, monitor API will use stdlib re${NC}"
+
+# Optional: NumPy for vectorized audio-level classification on high channel counts
+pip3 install --break-system-packages numpy==1.26.4 || \
+pip3 install numpy==1.26.4 || \
+echo -e "${YELLOW}⚠ numpy not available, monitor API will classify levels in Python${NC}"
 
 # ============================================================================
 # DOWNLOAD BINARIES